@@ -1,13 +1,14 @@
 """ Base Metadata Classes """
 
 import copy
+import functools
 import os
 import re
 import subprocess
+from collections import namedtuple
 from io import open
 from pprint import pformat as pretty
 
-import jsonschema
 from ruamel.yaml import YAML
 from ruamel.yaml.constructor import DuplicateKeyError
 from ruamel.yaml.error import YAMLError
@@ -24,6 +25,24 @@ SUFFIX = ".fmf"
 MAIN = "main" + SUFFIX
 IGNORED_DIRECTORIES = ['/dev', '/proc', '/sys']
 
+# Last characters of keys which may require special merging
+MERGE_SUFFIXES = ('+', '<', '-')
+
+# Attribute key split into the plain name and the merge operation
+MergeKey = namedtuple('MergeKey', ['name', 'operation', 'prepend'])
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_key(key):
+    """ Detect special merge suffix of the attribute key (cached) """
+    if key.endswith('+'):
+        return MergeKey(key.rstrip('+'), '+', False)
+    if key.endswith('+<'):
+        return MergeKey(key.rstrip('+<'), '+', True)
+    if key.endswith('-'):
+        return MergeKey(key.rstrip('-'), '-', False)
+    return MergeKey(key, None, False)
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #  Metadata
@@ -200,13 +219,16 @@ class Tree:
     def _merge_special(self, data, source):
         """ Merge source dict into data, handle special suffixes """
         for key, value in sorted(source.items()):
+            # Plain keys are the most common, just update the value
+            if not key.endswith(MERGE_SUFFIXES):
+                data[key] = value
+                continue
+            name, operation, prepend = _resolve_key(key)
             # Handle special attribute merging
-            if key.endswith('+'):
-                self._merge_plus(data, key.rstrip('+'), value)
-            elif key.endswith('+<'):
-                self._merge_plus(data, key.rstrip('+<'), value, prepend=True)
-            elif key.endswith('-'):
-                self._merge_minus(data, key.rstrip('-'), value)
+            if operation == '+':
+                self._merge_plus(data, name, value, prepend=prepend)
+            elif operation == '-':
+                self._merge_minus(data, name, value)
             # Otherwise just update the value
             else:
                 data[key] = value
@@ -677,6 +699,9 @@ class Tree:
 
         Raises utils.JsonSchemaError if the supplied schema was invalid.
         """
+        # Import on demand, jsonschema is slow to load and rarely needed
+        import jsonschema
+
         schema_store = schema_store or {}
         try:
             resolver = jsonschema.RefResolver.from_schema(
@@ -17,14 +17,63 @@ of available options.
 """
 
 import argparse
+import functools
 import os
 import os.path
 import shlex
 import sys
+from io import StringIO
 
 import fmf
 import fmf.utils as utils
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Constants
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# Metadata tree paths used when no --path option given
+DEFAULT_PATHS = (".",)
+
+# Maximum number of metadata trees kept in memory when caching enabled
+TREE_CACHE_SIZE = 32
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Tree Cache
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@functools.lru_cache(maxsize=TREE_CACHE_SIZE)
+def _cached_tree(path, mtime):
+    """ Cached tree for given path (mtime serves for invalidation) """
+    return fmf.Tree(path)
+
+
+def get_tree(path):
+    """
+    Initialize metadata tree for given path
+
+    If the FMF_CACHE_TREES environment variable is set to '1', parsed
+    trees are kept in memory and reused by subsequent calls as long as
+    the modification time of the directory does not change. This only
+    happens when an entry directly in the directory is created, removed
+    or renamed, editing content of any file (including the root
+    main.fmf) is not detected, thus caching is disabled by default.
+
+    The very same Tree object is returned for each cache hit, callers
+    must not modify it, otherwise the changes would affect all later
+    calls as well.
+    """
+    if os.environ.get("FMF_CACHE_TREES") != "1":
+        return fmf.Tree(path)
+    path = os.path.abspath(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    # Let the tree report invalid paths in the usual way
+    except OSError:
+        return fmf.Tree(path)
+    return _cached_tree(path, mtime)
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #  Parser
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -147,47 +196,63 @@ class Parser:
         self.options_utils()
         self.options = self.parser.parse_args(self.arguments[2:])
         # For each path create an .fmf directory and version file
-        for path in self.options.paths or ["."]:
+        for path in self.options.paths or DEFAULT_PATHS:
             root = fmf.Tree.init(path)
             print("Metadata tree '{0}' successfully initialized.".format(root))
 
     def show(self, brief=False):
         """ Show metadata for each path given """
-        output = []
-        for path in self.options.paths or ["."]:
-            if self.options.verbose:
+        output = StringIO()
+        count = 0
+        # Separate objects with an empty line unless listing names
+        # or using custom formatting
+        if brief or self.options.formatting:
+            separator = ""
+        else:
+            separator = "\n"
+        # Selection criteria are the same for all paths
+        select = (
+            self.options.whole,
+            self.options.keys,
+            self.options.names,
+            self.options.filters,
+            self.options.conditions,
+            self.options.sources)
+        # Decide how to show nodes just once
+        verbose = self.options.verbose
+        debug = self.options.debug
+        if brief:
+            def show_node(node):
+                return node.show(brief=True)
+        else:
+            formatting = self.options.formatting
+            values = self.options.values
+
+            def show_node(node):
+                return node.show(
+                    brief=False, formatting=formatting, values=values)
+        for path in self.options.paths or DEFAULT_PATHS:
+            if verbose:
                 utils.info("Checking {0} for metadata.".format(path))
-            tree = fmf.Tree(path)
-            for node in tree.prune(
-                    self.options.whole,
-                    self.options.keys,
-                    self.options.names,
-                    self.options.filters,
-                    self.options.conditions,
-                    self.options.sources):
-                if brief:
-                    show = node.show(brief=True)
-                else:
-                    show = node.show(
-                        brief=False,
-                        formatting=self.options.formatting,
-                        values=self.options.values)
+            tree = get_tree(path)
+            for node in tree.prune(*select):
+                show = show_node(node)
                 # List source files when in debug mode
-                if self.options.debug:
-                    for source in node.sources:
-                        show += utils.color("{0}\n".format(source), "blue")
+                if debug:
+                    show = "".join([show] + [
+                        utils.color("{0}\n".format(source), "blue")
+                        for source in node.sources])
                 if show is not None:
-                    output.append(show)
+                    if count:
+                        output.write(separator)
+                    output.write(show)
+                    count += 1
 
         # Print output and summary
-        if brief or self.options.formatting:
-            joined = "".join(output)
-        else:
-            joined = "\n".join(output)
-        print(joined, end="")
-        if self.options.verbose:
-            utils.info("Found {0}.".format(
-                utils.listed(len(output), "object")))
+        joined = output.getvalue()
+        sys.stdout.write(joined)
+        if verbose:
+            utils.info("Found {0}.".format(utils.listed(count, "object")))
         self.output = joined
 
     def clean(self):
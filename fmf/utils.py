@@ -12,7 +12,6 @@ import warnings
 from io import StringIO
 from typing import Any, List, NamedTuple
 
-from filelock import FileLock, Timeout
 from ruamel.yaml import YAML, scalarstring
 from ruamel.yaml.comments import CommentedMap
 
@@ -595,6 +594,9 @@ def clean_cache_directory():
 
 def invalidate_cache():
     """ Force fetch next time cache is used regardless its age """
+    # Locking is needed for remote trees only, import when used
+    from filelock import FileLock, Timeout
+
     # Missing FETCH_HEAD means `git fetch` will happen
     cache = get_cache_directory(create=False)
     # Cache not exists, nothing to do
@@ -640,6 +642,8 @@ def fetch_tree(url, ref=None, path='.'):
 
     Raises GeneralError when lock couldn't be acquired.
     """
+    from filelock import FileLock, Timeout
+
     # Create lock path to fetch/read git from URL to the cache
     cache_dir = get_cache_directory()
     # Use LOCK_SUFFIX_READ suffix (different from the inner fetch lock)
@@ -701,6 +705,7 @@ def fetch_repo(url, ref=None, destination=None, env=None):
 
     Raises FetchError upon failure with the original exception included.
     """
+    from filelock import FileLock, Timeout
 
     if destination is None:
         # Prepare the destination path
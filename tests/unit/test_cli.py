@@ -155,6 +155,26 @@ class TestCommandLine:
             "fmf ls --condition \"execute['wrong key'] == 0\"", path)
         assert output == ''
 
+    def test_tree_cache(self, monkeypatch):
+        """ Caching trees between calls """
+        monkeypatch.setenv("FMF_CACHE_TREES", "1")
+        fmf.cli._cached_tree.cache_clear()
+        try:
+            first = fmf.cli.main("fmf ls", WGET)
+            second = fmf.cli.main("fmf ls", WGET)
+            assert first == second
+            assert fmf.cli._cached_tree.cache_info().hits == 1
+            # Invalid path is still reported
+            with pytest.raises(utils.FileError):
+                fmf.cli.main("fmf show --path /some-non-existent-path")
+            # Disabled by default
+            monkeypatch.delenv("FMF_CACHE_TREES")
+            fmf.cli.main("fmf ls", WGET)
+            assert fmf.cli._cached_tree.cache_info().hits == 1
+        # Do not leave cached trees behind for other tests
+        finally:
+            fmf.cli._cached_tree.cache_clear()
+
     def test_clean(self, tmpdir, monkeypatch):
         """ Cache cleanup """
         # Do not manipulate with real, user's cache